@@ -7,7 +7,7 @@ demonstration purposes. It creates realistic network performance metrics
 across multiple sites, regions, and technologies.
 
 Usage:
-    python telecom_data_generator.py --sites 100 --chunks 50 --output data.csv
+    python telecom_data_generator.py --sites 100 --chunks 50 --output data.parquet
     
     # Save to S3
     python telecom_data_generator.py --sites 100 --chunks 50 --s3-bucket my-bucket --s3-key data/telecom_data.parquet
@@ -20,33 +20,152 @@ Or import as a module:
 import argparse
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-import random
 import sys
 import os
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Iterator, Optional
 
 # S3 support (optional import)
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
     from botocore.exceptions import ClientError, NoCredentialsError
     S3_AVAILABLE = True
+    
+    # Connection pool sized for the upload concurrency below, TCP keep-alive
+    # so multipart parts reuse connections, and adaptive retries for throttling
+    S3_CLIENT_CONFIG = Config(
+        max_pool_connections=64,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        tcp_keepalive=True
+    )
+    
+    # Smaller multipart parts with higher concurrency upload faster than
+    # the boto3 defaults (8 MiB parts, 10 threads)
+    S3_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=6 * 1024 * 1024,
+        multipart_chunksize=6 * 1024 * 1024,
+        max_concurrency=32,
+        use_threads=True
+    )
 except ImportError:
     S3_AVAILABLE = False
 
+# Arrow support for streamed and partitioned Parquet output (optional import)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# NumExpr support (optional import, speeds up the composite metric expressions)
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count() or 1)
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Arrow schema of the time-series output, fixed so streamed batches line up
+if PYARROW_AVAILABLE:
+    _LABEL_TYPE = pa.dictionary(pa.int32(), pa.string())
+    TIME_SERIES_SCHEMA = pa.schema([
+        ('timestamp', pa.timestamp('us')),
+        ('site_id', _LABEL_TYPE),
+        ('region', _LABEL_TYPE),
+        ('technology', _LABEL_TYPE),
+        ('vendor', _LABEL_TYPE),
+        ('rssi_dbm', pa.float32()),
+        ('latency_ms', pa.float32()),
+        ('data_volume_mb', pa.float32()),
+        ('drop_rate_percent', pa.float32()),
+        ('cpu_usage_percent', pa.float32()),
+        ('latitude', pa.float32()),
+        ('longitude', pa.float32())
+    ])
+
+
+def _compute_metrics(baseline_rssi: np.ndarray, baseline_latency: np.ndarray,
+                     baseline_volume: np.ndarray, vendor_modifier: np.ndarray,
+                     traffic_multiplier: np.ndarray, noise_rssi: np.ndarray,
+                     noise_latency: np.ndarray, noise_volume: np.ndarray,
+                     noise_cpu: np.ndarray, exp_drop: np.ndarray
+                     ) -> Tuple[np.ndarray, ...]:
+    """
+    Combine per-site baselines with pregenerated noise into metric arrays.
+    
+    Per-site inputs have shape (num_sites,), traffic_multiplier has shape
+    (num_time_chunks,) and the noise arrays have shape
+    (num_sites, num_time_chunks). Each noise array is updated in place and
+    returned as its metric, so no extra full-size buffers are allocated.
+    
+    Returns:
+        Tuple of (rssi, latency, data_volume, drop_rate, cpu_usage) arrays
+    """
+    baseline_rssi = baseline_rssi[:, None]
+    baseline_latency = baseline_latency[:, None]
+    baseline_volume = baseline_volume[:, None]
+    vendor_modifier = vendor_modifier[:, None]
+    
+    rssi = noise_rssi
+    rssi += baseline_rssi * vendor_modifier
+    np.clip(rssi, -120, -50, out=rssi)
+    
+    latency = noise_latency
+    latency += baseline_latency / vendor_modifier
+    np.maximum(latency, 1, out=latency)
+    
+    data_volume = noise_volume
+    if NUMEXPR_AVAILABLE:
+        ne.evaluate('bv * tr * vm + noise', out=data_volume, casting='same_kind',
+                    local_dict={'bv': baseline_volume, 'tr': traffic_multiplier,
+                                'vm': vendor_modifier, 'noise': noise_volume})
+    else:
+        data_volume += baseline_volume * traffic_multiplier * vendor_modifier
+    np.maximum(data_volume, 0, out=data_volume)
+    
+    drop_rate = exp_drop
+    drop_rate *= 1.1 - vendor_modifier
+    np.minimum(drop_rate, 20, out=drop_rate)
+    
+    cpu_usage = noise_cpu
+    if NUMEXPR_AVAILABLE:
+        ne.evaluate('(50 + 30 * tr + noise) / vm', out=cpu_usage, casting='same_kind',
+                    local_dict={'tr': traffic_multiplier, 'vm': vendor_modifier,
+                                'noise': noise_cpu})
+    else:
+        cpu_usage += 50 + 30 * traffic_multiplier
+        cpu_usage /= vendor_modifier
+    np.clip(cpu_usage, 0, 100, out=cpu_usage)
+    
+    return rssi, latency, data_volume, drop_rate, cpu_usage
+
+
+def _build_time_series_shard(generator: 'TelecomDataGenerator',
+                             seed_seq: np.random.SeedSequence,
+                             sites_df: pd.DataFrame, timestamps: np.ndarray,
+                             traffic_multiplier: np.ndarray,
+                             site_id_categories: np.ndarray) -> pd.DataFrame:
+    """Worker entry point: build one shard of sites with its own random stream."""
+    generator.rng = np.random.default_rng(seed_seq)
+    return generator._build_time_series(
+        sites_df, timestamps, traffic_multiplier, site_id_categories
+    )
+
 
 class TelecomDataGenerator:
     """Generator for synthetic telecom time-series data."""
     
     def __init__(self, seed: Optional[int] = None):
         """Initialize the generator with optional random seed."""
-        if seed is not None:
-            np.random.seed(seed)
-            random.seed(seed)
-        
-        # Store Python's built-in functions before any potential conflicts
-        self.python_min = min
-        self.python_max = max
+        # All random draws come from this generator; global RNG state is untouched
+        self.seed_seq = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_seq)
         
         # Telecom infrastructure configuration
         self.regions = ['North', 'South', 'East', 'West', 'Central']
@@ -62,146 +181,384 @@ class TelecomDataGenerator:
             '8G': {'rssi': -65, 'latency': 5, 'data_volume': 8000}
         }
         
-        # Initialize S3 client if available
+        # Performance modifiers by vendor
+        self.vendor_modifiers = {
+            'Ericsson': 1.05,
+            'Nokia': 1.02,
+            'Huawei': 0.98,
+            'Samsung': 1.01
+        }
+        
+        # S3 client is created on first use and reused for the same credentials
         self.s3_client = None
-        if S3_AVAILABLE:
-            try:
-                self.s3_client = boto3.client('s3')
-            except Exception:
-                pass  # S3 client initialization will be handled later if needed
+        self._s3_client_settings = None
+    
+    def __getstate__(self) -> dict:
+        """Pickle without the S3 client so generators can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state['s3_client'] = None
+        state['_s3_client_settings'] = None
+        return state
     
     def generate_site_metadata(self, num_sites: int) -> pd.DataFrame:
         """Generate metadata for telecom sites."""
-        sites = []
-        
-        for site_id in range(1, num_sites + 1):
-            site = {
-                'site_id': f'SITE_{site_id:04d}',
-                'region': random.choice(self.regions),
-                'technology': random.choice(self.technologies),
-                'vendor': random.choice(self.vendors),
-                'latitude': round(np.random.uniform(25.0, 49.0), 6),
-                'longitude': round(np.random.uniform(-125.0, -66.0), 6),
-                'installation_date': (
-                    datetime.now() - timedelta(days=random.randint(30, 1825))
-                ).strftime('%Y-%m-%d')
-            }
-            sites.append(site)
-        
-        return pd.DataFrame(sites)
+        install_age_days = self.rng.integers(30, 1826, size=num_sites)
+        installation_dates = (
+            np.datetime64(datetime.now().date()) - install_age_days.astype('timedelta64[D]')
+        ).astype(str)
+        
+        site_ids = np.char.add(
+            'SITE_', np.char.zfill(np.arange(1, num_sites + 1).astype(str), 4)
+        )
+        
+        return pd.DataFrame({
+            'site_id': site_ids,
+            'region': self.rng.choice(self.regions, size=num_sites),
+            'technology': self.rng.choice(self.technologies, size=num_sites),
+            'vendor': self.rng.choice(self.vendors, size=num_sites),
+            'latitude': np.round(self.rng.uniform(25.0, 49.0, size=num_sites), 6),
+            'longitude': np.round(self.rng.uniform(-125.0, -66.0, size=num_sites), 6),
+            'installation_date': installation_dates
+        })
     
     def generate_time_series_data(self, sites_df: pd.DataFrame, 
-                                num_time_chunks: int) -> pd.DataFrame:
-        """Generate time-series performance data for all sites."""
-        data = []
+                                num_time_chunks: int, workers: int = 1,
+                                verbose: bool = False) -> pd.DataFrame:
+        """
+        Generate time-series performance data for all sites.
+        
+        With workers > 1 the sites are split into shards generated in
+        separate processes, each with an independent random stream. Output
+        is reproducible only for the same seed and the same worker count.
+        Progress messages are only printed when verbose is set.
+        """
         base_time = datetime.now() - timedelta(hours=num_time_chunks)
         
-        print(f"Generating time-series data for {len(sites_df)} sites...")
+        if verbose:
+            print(f"Generating time-series data for {len(sites_df)} sites...")
         
-        for idx, site in sites_df.iterrows():
-            if idx % 50 == 0:
-                print(f"Processing site {idx + 1}/{len(sites_df)}")
-            
-            # Get technology baseline
-            tech = site['technology']
-            baseline = self.tech_baselines[tech]
-            
-            # Generate vendor performance modifier
-            vendor_modifier = {
-                'Ericsson': 1.05,
-                'Nokia': 1.02,
-                'Huawei': 0.98,
-                'Samsung': 1.01
-            }[site['vendor']]
-            
-            for hour in range(num_time_chunks):
-                timestamp = base_time + timedelta(hours=hour)
-                
-                # Add daily and weekly patterns
-                hour_of_day = timestamp.hour
-                day_of_week = timestamp.weekday()
-                
-                # Traffic patterns (higher during business hours and weekdays)
-                traffic_multiplier = 1.0
-                if 8 <= hour_of_day <= 18:  # Business hours
-                    traffic_multiplier *= 1.5
-                if day_of_week < 5:  # Weekdays
-                    traffic_multiplier *= 1.3
-                
-                # Generate metrics with realistic variations
-                rssi = baseline['rssi'] * vendor_modifier + np.random.normal(0, 5)
-                rssi = self.python_max(-120, self.python_min(-50, rssi))
-                
-                latency = baseline['latency'] / vendor_modifier + np.random.normal(0, 3)
-                latency = self.python_max(1, latency)
-                
-                data_volume = (baseline['data_volume'] * traffic_multiplier * 
-                             vendor_modifier + np.random.normal(0, 100))
-                data_volume = self.python_max(0, data_volume)
-                
-                drop_rate = np.random.exponential(0.5) * (1.1 - vendor_modifier)
-                drop_rate = self.python_min(20, drop_rate)
-                
-                cpu_usage = (50 + 30 * traffic_multiplier + 
-                           np.random.normal(0, 10)) / vendor_modifier
-                cpu_usage = self.python_max(0, self.python_min(100, cpu_usage))
-                
-                record = {
-                    'timestamp': timestamp,
-                    'site_id': site['site_id'],
-                    'region': site['region'],
-                    'technology': site['technology'],
-                    'vendor': site['vendor'],
-                    'rssi_dbm': round(rssi, 2),
-                    'latency_ms': round(latency, 2),
-                    'data_volume_mb': round(data_volume, 2),
-                    'drop_rate_percent': round(drop_rate, 3),
-                    'cpu_usage_percent': round(cpu_usage, 1),
-                    'latitude': site['latitude'],
-                    'longitude': site['longitude']
-                }
-                data.append(record)
-        
-        return pd.DataFrame(data)
+        timestamps, traffic_multiplier = self._hourly_timeline(num_time_chunks, base_time)
+        if workers > 1 and len(sites_df) > 1:
+            return self._build_time_series_parallel(
+                sites_df, timestamps, traffic_multiplier, workers
+            )
+        return self._build_time_series(sites_df, timestamps, traffic_multiplier)
+    
+    def _build_time_series_parallel(self, sites_df: pd.DataFrame, timestamps: np.ndarray,
+                                   traffic_multiplier: np.ndarray,
+                                   workers: int) -> pd.DataFrame:
+        """
+        Build performance records for site shards across worker processes.
+        
+        Each shard draws from a seed spawned from self.seed_seq, so results
+        depend on the number of shards as well as the seed.
+        """
+        shard_bounds = np.array_split(np.arange(len(sites_df)), min(workers, len(sites_df)))
+        shard_seeds = self.seed_seq.spawn(len(shard_bounds))
+        # Every shard encodes site_id against the full site list, so all shards
+        # share one CategoricalDtype and concat stays on integer codes
+        site_id_categories = sites_df['site_id'].to_numpy()
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(
+                _build_time_series_shard,
+                [self] * len(shard_bounds),
+                shard_seeds,
+                [sites_df.iloc[bounds[0]:bounds[-1] + 1] for bounds in shard_bounds],
+                [timestamps] * len(shard_bounds),
+                [traffic_multiplier] * len(shard_bounds),
+                [site_id_categories] * len(shard_bounds)
+            ))
+        
+        return pd.concat(shards, ignore_index=True)
+    
+    def _hourly_timeline(self, num_time_chunks: int,
+                        base_time: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the hourly timestamps and traffic multipliers shared by all sites.
+        
+        Returns:
+            Tuple of (timestamps, traffic_multiplier), each of shape (num_time_chunks,)
+        """
+        # Microsecond precision matches Iceberg's timestamp type
+        timestamps = (
+            np.datetime64(base_time, 'us') +
+            np.arange(num_time_chunks, dtype='timedelta64[h]')
+        )
+        
+        # Add daily and weekly patterns from the epoch offsets
+        # (1970-01-01 was a Thursday, weekday 3)
+        hour_of_day = timestamps.astype('datetime64[h]').view('int64') % 24
+        day_of_week = (timestamps.astype('datetime64[D]').view('int64') + 3) % 7
+        
+        # Traffic patterns (higher during business hours and weekdays)
+        traffic_multiplier = (
+            np.where((hour_of_day >= 8) & (hour_of_day <= 18), 1.5, 1.0) *
+            np.where(day_of_week < 5, 1.3, 1.0)
+        )
+        
+        return timestamps, traffic_multiplier
+    
+    def _build_time_series(self, sites_df: pd.DataFrame, timestamps: np.ndarray,
+                          traffic_multiplier: np.ndarray,
+                          site_id_categories: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Build performance records for the given sites over a precomputed timeline."""
+        return pd.DataFrame(
+            self._time_series_columns(
+                sites_df, timestamps, traffic_multiplier, site_id_categories
+            ),
+            copy=False
+        )
+    
+    def _build_time_series_batch(self, sites_df: pd.DataFrame, timestamps: np.ndarray,
+                                traffic_multiplier: np.ndarray) -> 'pa.RecordBatch':
+        """Build performance records as an Arrow record batch, bypassing pandas."""
+        columns = self._time_series_columns(sites_df, timestamps, traffic_multiplier)
+        arrays = []
+        for field in TIME_SERIES_SCHEMA:
+            values = columns[field.name]
+            if isinstance(values, pd.Categorical):
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    values.codes.astype(np.int32),
+                    pa.array(values.categories.to_numpy(dtype=str), type=pa.string())
+                ))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=TIME_SERIES_SCHEMA)
+    
+    def _time_series_columns(self, sites_df: pd.DataFrame, timestamps: np.ndarray,
+                            traffic_multiplier: np.ndarray,
+                            site_id_categories: Optional[np.ndarray] = None
+                            ) -> Dict[str, object]:
+        """
+        Compute the time-series output columns for the given sites.
+        
+        site_id_categories sets the site_id categories (default: the site ids
+        in sites_df), so shards of one dataset can share a single dtype.
+        
+        Returns:
+            Dict of column name to NumPy array, or pd.Categorical for label columns
+        """
+        num_sites = len(sites_df)
+        num_time_chunks = len(timestamps)
+        
+        # Per-site technology baselines and vendor performance modifiers,
+        # looked up by categorical code instead of per-site dict access
+        def label_codes(column: str, categories: List[str]) -> np.ndarray:
+            codes = pd.Categorical(sites_df[column], categories=categories).codes
+            if (codes < 0).any():
+                unknown = sorted(set(sites_df[column][codes < 0].astype(str)))
+                raise ValueError(f"Unknown {column} value(s): {', '.join(unknown)}")
+            return codes
+        
+        tech_codes = label_codes('technology', list(self.tech_baselines))
+        baselines = self.tech_baselines.values()
+        baseline_rssi = np.array([b['rssi'] for b in baselines], dtype=float)[tech_codes]
+        baseline_latency = np.array([b['latency'] for b in baselines], dtype=float)[tech_codes]
+        baseline_volume = np.array([b['data_volume'] for b in baselines], dtype=float)[tech_codes]
+        
+        vendor_codes = label_codes('vendor', list(self.vendor_modifiers))
+        vendor_modifier = np.array(list(self.vendor_modifiers.values()))[vendor_codes]
+        
+        # Random variations of shape (num_sites, num_time_chunks), drawn in
+        # bulk as float32 since that is the precision of the output columns
+        shape = (num_sites, num_time_chunks)
+        
+        def normal_noise(scale: float) -> np.ndarray:
+            noise = self.rng.standard_normal(shape, dtype=np.float32)
+            noise *= scale
+            return noise
+        
+        exp_drop = self.rng.standard_exponential(shape, dtype=np.float32)
+        exp_drop *= 0.5
+        
+        rssi, latency, data_volume, drop_rate, cpu_usage = _compute_metrics(
+            baseline_rssi, baseline_latency, baseline_volume,
+            vendor_modifier, traffic_multiplier,
+            noise_rssi=normal_noise(5),
+            noise_latency=normal_noise(3),
+            noise_volume=normal_noise(100),
+            noise_cpu=normal_noise(10),
+            exp_drop=exp_drop
+        )
+        
+        # Site attributes repeat per hour; timestamps repeat per site
+        site_columns = {
+            column: sites_df[column].to_numpy()
+            for column in ('site_id', 'region', 'technology', 'vendor',
+                           'latitude', 'longitude')
+        }
+        
+        def per_site(column: str) -> np.ndarray:
+            return np.repeat(site_columns[column], num_time_chunks)
+        
+        def per_site_category(column: str, categories: List[str]) -> pd.Categorical:
+            # Repeat the small integer codes rather than the label strings
+            codes = pd.Categorical(site_columns[column], categories=categories).codes
+            return pd.Categorical.from_codes(
+                np.repeat(codes, num_time_chunks), categories=categories
+            )
+        
+        def per_record(values: np.ndarray, decimals: int) -> np.ndarray:
+            # Narrow to float32 first so the single rounding pass covers half the bytes
+            column = values.ravel().astype(np.float32, copy=False)
+            return np.round(column, decimals, out=column)
+        
+        # Compact dtypes: float32 metrics and categorical labels roughly halve
+        # memory and let Parquet dictionary-encode the label columns
+        return {
+            'timestamp': np.tile(timestamps, num_sites),
+            'site_id': per_site_category(
+                'site_id',
+                site_columns['site_id'] if site_id_categories is None else site_id_categories
+            ),
+            'region': per_site_category('region', self.regions),
+            'technology': per_site_category('technology', self.technologies),
+            'vendor': per_site_category('vendor', self.vendors),
+            'rssi_dbm': per_record(rssi, 2),
+            'latency_ms': per_record(latency, 2),
+            'data_volume_mb': per_record(data_volume, 2),
+            'drop_rate_percent': per_record(drop_rate, 3),
+            'cpu_usage_percent': per_record(cpu_usage, 1),
+            'latitude': per_site('latitude').astype(np.float32),
+            'longitude': per_site('longitude').astype(np.float32)
+        }
     
     def generate_telecom_data(self, num_sites: int = 100, 
-                            num_time_chunks: int = 50) -> pd.DataFrame:
+                            num_time_chunks: int = 50, workers: int = 1,
+                            verbose: bool = False) -> pd.DataFrame:
         """Generate complete telecom dataset."""
-        print(f"Generating telecom data: {num_sites} sites, {num_time_chunks} time chunks")
+        if verbose:
+            print(f"Generating telecom data: {num_sites} sites, {num_time_chunks} time chunks")
         
         # Generate site metadata
         sites_df = self.generate_site_metadata(num_sites)
-        print(f"Generated metadata for {len(sites_df)} sites")
+        if verbose:
+            print(f"Generated metadata for {len(sites_df)} sites")
         
         # Generate time-series data
-        data_df = self.generate_time_series_data(sites_df, num_time_chunks)
-        print(f"Generated {len(data_df):,} records")
+        data_df = self.generate_time_series_data(sites_df, num_time_chunks, workers, verbose)
+        if verbose:
+            print(f"Generated {len(data_df):,} records")
         
         return data_df
     
+    def iter_time_series_batches(self, sites_df: pd.DataFrame, num_time_chunks: int,
+                                 sites_per_batch: int = 100) -> Iterator['pa.RecordBatch']:
+        """Yield time-series data as Arrow record batches of sites_per_batch sites."""
+        base_time = datetime.now() - timedelta(hours=num_time_chunks)
+        timestamps, traffic_multiplier = self._hourly_timeline(num_time_chunks, base_time)
+        
+        for start in range(0, len(sites_df), sites_per_batch):
+            yield self._build_time_series_batch(
+                sites_df.iloc[start:start + sites_per_batch], timestamps, traffic_multiplier
+            )
+    
+    def stream_to_parquet(self, num_sites: int, num_time_chunks: int,
+                         output_file: str = None, s3_bucket: str = None,
+                         s3_key: str = None, aws_access_key_id: str = None,
+                         aws_secret_access_key: str = None,
+                         aws_region: str = 'us-east-1',
+                         sites_per_batch: int = 100, verbose: bool = False) -> bool:
+        """
+        Generate telecom data straight into a Parquet file, one batch at a time.
+        
+        Only sites_per_batch sites worth of records are held in memory, so
+        peak memory no longer grows with num_sites. Writes to S3 when
+        s3_bucket and s3_key are given, otherwise to output_file. A
+        destination without a .parquet extension gets one appended, and .csv
+        destinations are rejected. Progress messages are only printed when
+        verbose is set.
+        
+        The streamed layout differs from _write_parquet: rows stay in site
+        order (not sorted by region/technology/timestamp) and each batch is
+        written as its own row group, so row-group pruning is weaker.
+        
+        Returns:
+            True if the file was written successfully
+        """
+        if not PYARROW_AVAILABLE:
+            print("ERROR: Streaming Parquet output requires pyarrow. Install with: pip install pyarrow")
+            return False
+        
+        to_s3 = bool(s3_bucket and s3_key)
+        destination_path = s3_key if to_s3 else output_file
+        if not destination_path:
+            print("ERROR: No output destination specified (local file or S3)")
+            return False
+        if destination_path.endswith('.csv'):
+            print("ERROR: Streaming only writes Parquet; use a .parquet destination")
+            return False
+        if not destination_path.endswith('.parquet'):
+            # Default to parquet, as save_to_s3 and _save_local_file do
+            destination_path += '.parquet'
+        
+        if verbose:
+            print(f"Streaming telecom data: {num_sites} sites, {num_time_chunks} time chunks")
+        sites_df = self.generate_site_metadata(num_sites)
+        
+        try:
+            if to_s3:
+                s3 = pafs.S3FileSystem(
+                    access_key=aws_access_key_id,
+                    secret_key=aws_secret_access_key,
+                    region=aws_region
+                )
+                sink = s3.open_output_stream(f"{s3_bucket}/{destination_path}")
+                destination = f"s3://{s3_bucket}/{destination_path}"
+            else:
+                sink = pa.OSFile(destination_path, 'wb')
+                destination = destination_path
+            
+            num_rows = 0
+            with sink, pq.ParquetWriter(sink, TIME_SERIES_SCHEMA, compression='zstd') as writer:
+                for batch in self.iter_time_series_batches(
+                    sites_df, num_time_chunks, sites_per_batch
+                ):
+                    writer.write_batch(batch)
+                    num_rows += batch.num_rows
+                    if verbose:
+                        print(f"Wrote {num_rows:,} records")
+            
+            print(f"Data streamed to {destination} (Parquet format)")
+            print(f"Dataset info: {num_rows:,} rows, {len(TIME_SERIES_SCHEMA)} columns")
+            return True
+            
+        except Exception as e:
+            print(f"ERROR: Failed to stream Parquet output: {e}")
+            return False
+    
     def _setup_s3_client(self, aws_access_key_id: Optional[str] = None,
                         aws_secret_access_key: Optional[str] = None,
                         aws_region: str = 'us-east-1') -> bool:
-        """Setup S3 client with credentials."""
+        """Setup S3 client with credentials, reusing the existing client if unchanged."""
         if not S3_AVAILABLE:
             print("ERROR: boto3 is not installed. Install with: pip install boto3")
             return False
         
+        settings = (aws_access_key_id, aws_secret_access_key, aws_region)
+        if self.s3_client is not None and self._s3_client_settings == settings:
+            return True
+        
         try:
             # Use provided credentials or environment variables
             if aws_access_key_id and aws_secret_access_key:
-                self.s3_client = boto3.client(
+                s3_client = boto3.client(
                     's3',
                     aws_access_key_id=aws_access_key_id,
                     aws_secret_access_key=aws_secret_access_key,
-                    region_name=aws_region
+                    region_name=aws_region,
+                    config=S3_CLIENT_CONFIG
                 )
             else:
                 # Use default credential chain (environment variables, IAM roles, etc.)
-                self.s3_client = boto3.client('s3', region_name=aws_region)
+                s3_client = boto3.client('s3', region_name=aws_region, config=S3_CLIENT_CONFIG)
             
             # Test credentials by listing buckets (or at least attempting to)
-            self.s3_client.list_buckets()
+            s3_client.list_buckets()
+            
+            self.s3_client = s3_client
+            self._s3_client_settings = settings
             return True
             
         except NoCredentialsError:
@@ -228,34 +585,33 @@ class TelecomDataGenerator:
                 # Save as parquet (recommended for Iceberg)
                 import io
                 buffer = io.BytesIO()
-                data_df.to_parquet(buffer, index=False)
+                self._write_parquet(data_df, buffer)
                 buffer.seek(0)
                 
-                self.s3_client.upload_fileobj(buffer, bucket, key)
+                self.s3_client.upload_fileobj(buffer, bucket, key, Config=S3_TRANSFER_CONFIG)
                 print(f"Data uploaded to s3://{bucket}/{key} (Parquet format)")
                 
             elif key.endswith('.csv'):
-                # Save as CSV
+                # Save as CSV (multipart upload so large files are not a single PUT)
                 import io
-                buffer = io.StringIO()
+                buffer = io.BytesIO()
                 data_df.to_csv(buffer, index=False)
+                buffer.seek(0)
                 
-                self.s3_client.put_object(
-                    Bucket=bucket,
-                    Key=key,
-                    Body=buffer.getvalue()
-                )
+                self.s3_client.upload_fileobj(buffer, bucket, key, Config=S3_TRANSFER_CONFIG)
                 print(f"Data uploaded to s3://{bucket}/{key} (CSV format)")
                 
             else:
                 # Default to parquet
                 import io
                 buffer = io.BytesIO()
-                data_df.to_parquet(buffer, index=False)
+                self._write_parquet(data_df, buffer)
                 buffer.seek(0)
                 
                 parquet_key = key + '.parquet' if not key.endswith('.parquet') else key
-                self.s3_client.upload_fileobj(buffer, bucket, parquet_key)
+                self.s3_client.upload_fileobj(
+                    buffer, bucket, parquet_key, Config=S3_TRANSFER_CONFIG
+                )
                 print(f"Data uploaded to s3://{bucket}/{parquet_key} (Parquet format)")
             
             print(f"Dataset info: {len(data_df):,} rows, {len(data_df.columns)} columns")
@@ -271,7 +627,8 @@ class TelecomDataGenerator:
     def save_data(self, data_df: pd.DataFrame, output_file: str = None,
                  s3_bucket: str = None, s3_key: str = None,
                  aws_access_key_id: str = None, aws_secret_access_key: str = None,
-                 aws_region: str = 'us-east-1') -> None:
+                 aws_region: str = 'us-east-1',
+                 partition_by: Optional[List[str]] = None) -> None:
         """Save generated data to file or S3."""
         
         if s3_bucket and s3_key:
@@ -283,29 +640,91 @@ class TelecomDataGenerator:
             if not success:
                 print("S3 upload failed. Falling back to local file save.")
                 if output_file:
-                    self._save_local_file(data_df, output_file)
+                    self._save_local_file(data_df, output_file, partition_by)
         elif output_file:
             # Save to local file
-            self._save_local_file(data_df, output_file)
+            self._save_local_file(data_df, output_file, partition_by)
         else:
             print("ERROR: No output destination specified (local file or S3)")
     
-    def _save_local_file(self, data_df: pd.DataFrame, output_file: str) -> None:
-        """Save DataFrame to local file."""
-        if output_file.endswith('.csv'):
+    def _write_parquet(self, data_df: pd.DataFrame, target) -> None:
+        """
+        Write DataFrame as Parquet laid out for column scans and pruning.
+        
+        Rows are sorted by region, technology and timestamp so row-group
+        min/max statistics let query engines skip row groups on those filters.
+        Label columns sort by their string values, matching how Parquet
+        compares them, rather than by category order; reordering the
+        categories alphabetically keeps the sort on integer codes.
+        """
+        def sort_key(column: pd.Series) -> pd.Series:
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                return column.cat.reorder_categories(sorted(column.cat.categories))
+            return column
+        
+        data_df.sort_values(['region', 'technology', 'timestamp'], key=sort_key).to_parquet(
+            target,
+            engine='pyarrow',
+            index=False,
+            compression='zstd',
+            row_group_size=1_000_000,
+            use_dictionary=['site_id', 'region', 'technology', 'vendor'],
+            write_statistics=True
+        )
+    
+    def _write_partitioned_parquet(self, data_df: pd.DataFrame, base_dir: str,
+                                   partition_by: List[str]) -> None:
+        """
+        Write DataFrame as a Hive-partitioned Parquet dataset under base_dir.
+        
+        Produces one directory level per partition column (for example
+        region=North/technology=5G/), which query engines and Iceberg
+        add_files can prune at plan time. Existing files in any partition
+        directory that this write touches are deleted first.
+        """
+        table = pa.Table.from_pandas(
+            data_df.sort_values('timestamp'), preserve_index=False
+        )
+        ds.write_dataset(
+            table,
+            base_dir=base_dir,
+            format='parquet',
+            partitioning=ds.partitioning(
+                table.select(partition_by).schema, flavor='hive'
+            ),
+            max_rows_per_file=2_000_000,
+            max_rows_per_group=1_000_000,
+            file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+            existing_data_behavior='delete_matching'
+        )
+    
+    def _save_local_file(self, data_df: pd.DataFrame, output_file: str,
+                        partition_by: Optional[List[str]] = None) -> None:
+        """Save DataFrame to local file, or a partitioned dataset directory."""
+        if partition_by or output_file.endswith('/'):
+            # Directory output: Hive-partitioned Parquet dataset
+            if not PYARROW_AVAILABLE:
+                print("ERROR: Partitioned Parquet output requires pyarrow. Install with: pip install pyarrow")
+                return
+            self._write_partitioned_parquet(
+                data_df, output_file, partition_by or ['region', 'technology']
+            )
+        elif output_file.endswith('.csv'):
             data_df.to_csv(output_file, index=False)
         elif output_file.endswith('.parquet'):
-            data_df.to_parquet(output_file, index=False)
+            self._write_parquet(data_df, output_file)
         else:
-            # Default to CSV
-            data_df.to_csv(output_file + '.csv', index=False)
+            # Default to parquet
+            output_file += '.parquet'
+            self._write_parquet(data_df, output_file)
         
         print(f"Data saved to {output_file}")
         print(f"Dataset info: {len(data_df):,} rows, {len(data_df.columns)} columns")
 
 
 def generate_telecom_data(num_sites: int = 100, num_time_chunks: int = 50, 
-                         seed: Optional[int] = None) -> pd.DataFrame:
+                         seed: Optional[int] = None, workers: int = 1,
+                         verbose: bool = False) -> pd.DataFrame:
     """
     Convenience function to generate telecom data.
     
@@ -313,12 +732,15 @@ def generate_telecom_data(num_sites: int = 100, num_time_chunks: int = 50,
         num_sites: Number of telecom sites to generate
         num_time_chunks: Number of time periods for each site
         seed: Random seed for reproducibility
+        workers: Number of processes to split site generation across
+            (output is reproducible for the same seed and worker count)
+        verbose: Print progress messages while generating
     
     Returns:
         DataFrame with generated telecom time-series data
     """
     generator = TelecomDataGenerator(seed=seed)
-    return generator.generate_telecom_data(num_sites, num_time_chunks)
+    return generator.generate_telecom_data(num_sites, num_time_chunks, workers, verbose)
 
 
 def main():
@@ -339,8 +761,8 @@ def main():
     )
     
     parser.add_argument(
-        '--output', type=str, default='telecom_data.csv',
-        help='Output file path (supports .csv and .parquet)'
+        '--output', type=str, default='telecom_data.parquet',
+        help='Output file path (supports .parquet and .csv)'
     )
     
     parser.add_argument(
@@ -348,11 +770,42 @@ def main():
         help='Random seed for reproducible data generation'
     )
     
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='Number of worker processes for time-series generation '
+             '(output is reproducible only for the same --seed and --workers)'
+    )
+    
+    parser.add_argument(
+        '--verbose', action='store_true',
+        help='Print progress messages during data generation'
+    )
+    
     parser.add_argument(
         '--preview', action='store_true',
         help='Show data preview instead of saving to file'
     )
     
+    parser.add_argument(
+        '--partition-by', type=str, default=None,
+        help='Comma-separated columns to Hive-partition Parquet output by, '
+             'e.g. region,technology (output is written as a directory; '
+             'an --output path ending in "/" defaults to region,technology). '
+             'Existing files in partitions being written are deleted. '
+             'Local output only'
+    )
+    
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='Stream Parquet output batch by batch instead of building the full dataset in memory '
+             '(rows are unsorted, one row group per batch)'
+    )
+    
+    parser.add_argument(
+        '--batch-sites', type=int, default=100,
+        help='Number of sites per streamed Parquet batch (with --stream)'
+    )
+    
     # S3 options
     parser.add_argument(
         '--s3-bucket', type=str, default=None,
@@ -395,10 +848,44 @@ def main():
         print("ERROR: --s3-bucket is required when --s3-key is specified")
         sys.exit(1)
     
+    if args.stream and args.preview:
+        print("ERROR: --stream cannot be combined with --preview")
+        sys.exit(1)
+    
+    if args.stream and args.partition_by:
+        print("ERROR: --stream cannot be combined with --partition-by")
+        sys.exit(1)
+    
+    if args.partition_by and args.s3_bucket:
+        print("ERROR: --partition-by is only supported for local output, not S3")
+        sys.exit(1)
+    
+    if args.stream and args.workers > 1:
+        print("ERROR: --stream cannot be combined with --workers")
+        sys.exit(1)
+    
     try:
-        # Generate data
         generator = TelecomDataGenerator(seed=args.seed)
-        data_df = generator.generate_telecom_data(args.sites, args.chunks)
+        
+        if args.stream:
+            # Stream Parquet output without materializing the full dataset
+            success = generator.stream_to_parquet(
+                args.sites, args.chunks,
+                output_file=args.output,
+                s3_bucket=args.s3_bucket,
+                s3_key=args.s3_key,
+                aws_access_key_id=args.aws_access_key,
+                aws_secret_access_key=args.aws_secret_key,
+                aws_region=args.aws_region,
+                sites_per_batch=args.batch_sites,
+                verbose=args.verbose
+            )
+            sys.exit(0 if success else 1)
+        
+        # Generate data
+        data_df = generator.generate_telecom_data(
+            args.sites, args.chunks, args.workers, args.verbose
+        )
         
         if args.preview:
             print("\nData Preview:")
@@ -415,7 +902,8 @@ def main():
                 s3_key=args.s3_key,
                 aws_access_key_id=args.aws_access_key,
                 aws_secret_access_key=args.aws_secret_key,
-                aws_region=args.aws_region
+                aws_region=args.aws_region,
+                partition_by=args.partition_by.split(',') if args.partition_by else None
             )
             
     except KeyboardInterrupt: